@@ -2,34 +2,140 @@
 import logging
 import time
 import datetime
+import functools
+import heapq
+import sys
 import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from collections.abc import Callable
-from typing import Union, Sequence, Any, Tuple, List
+from typing import Union, Sequence, Iterable, Any, Tuple, List, Optional, Set
 import types
 
 
 logger = logging.getLogger('pycronner')
 
+_ONE_SECOND = datetime.timedelta(seconds=1)
+_ONE_MINUTE = datetime.timedelta(minutes=1)
+_ONE_HOUR = datetime.timedelta(hours=1)
+_ONE_DAY = datetime.timedelta(days=1)
+# long enough for any valid day/weekday combination to come around again
+_MAX_SKIPPED_DAYS = 366 * 8
+# an interval counts as elapsed this much early, so dispatch latency cannot push a run to the next second
+_INTERVAL_ALLOWANCE = 0.5
+# a change in the wall clock against the monotonic clock larger than this is treated as a clock step
+_CLOCK_STEP_THRESHOLD = 1.0
+# the longest the scheduler waits before checking the clock again, so a clock step is noticed before a fire time is passed
+_MAX_WAIT = 1.0
+_UNIT_SECOND = sys.intern('second')
+_UNIT_MINUTE = sys.intern('minute')
+_UNIT_HOUR = sys.intern('hour')
+_UNIT_DAY = sys.intern('day')
+_UNIT_SECONDS = {
+    _UNIT_SECOND: 1,
+    _UNIT_MINUTE: 60,
+    _UNIT_HOUR: 60 * 60,
+    _UNIT_DAY: 24 * 60 * 60,
+}
+
+
+def _ceil_second(value: datetime.datetime) -> datetime.datetime:
+    if value.microsecond:
+        return value.replace(microsecond=0) + _ONE_SECOND
+    return value
+
+
+def _bit_mask(values: frozenset) -> int:
+    # an empty set matches every value; -1 has every bit set
+    if not values:
+        return -1
+    mask = 0
+    for value in values:
+        if 0 <= value < 64:
+            mask |= 1 << value
+    return mask
+
+
+def _next_in_mask(mask: int, value: int, limit: int) -> Optional[int]:
+    # smallest allowed value in [value, limit), found from the lowest set bit
+    remaining = (mask >> value) & ((1 << (limit - value)) - 1)
+    if not remaining:
+        return None
+    return value + (remaining & -remaining).bit_length() - 1
+
+
+def _match_any(time_now: datetime.datetime) -> bool:
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_matcher(second_mask: int, minute_mask: int, hour_mask: int, day_mask: int, weekday_mask: int) \
+        -> Callable[[datetime.datetime], bool]:
+    # generates a function that only tests the constrained fields, with the allowed values inlined
+    conditions = []
+    for expression, mask in (('time_now.second', second_mask),
+                             ('time_now.minute', minute_mask),
+                             ('time_now.hour', hour_mask),
+                             ('time_now.day', day_mask),
+                             ('time_now.weekday()', weekday_mask)):
+        if mask == -1:
+            continue
+
+        values = tuple(value for value in range(64) if (mask >> value) & 1)
+        if not values:
+            conditions.append('True')
+        elif len(values) == 1:
+            conditions.append(f'{expression} != {values[0]}')
+        elif len(values) <= 4:
+            conditions.append(f'{expression} not in {values!r}')
+        else:
+            conditions.append(f'not ({mask} >> {expression}) & 1')
+
+    if not conditions:
+        return _match_any
+
+    source = 'def matches(time_now):\n'
+    for condition in conditions:
+        source += f'    if {condition}:\n        return False\n'
+    source += '    return True\n'
+
+    namespace = {}
+    exec(source, namespace)
+    return namespace['matches']
+
+
+def _as_tuple(items: Union[int, Sequence[int], None]) -> Tuple[int, ...]:
+    if items is None:
+        return ()
+    if isinstance(items, int):
+        return items,
+    return tuple(items)
+
 
 class JobStatus(object):
+    __slots__ = ('_running', 'last_run_time', 'last_run_monotonic')
+
     def __init__(self):
-        self._is_running = False
+        self._running = threading.Event()
         self.last_run_time = None
+        self.last_run_monotonic: Optional[float] = None
 
     @property
     def is_running(self):
-        return self._is_running
+        return self._running.is_set()
 
-    def start(self):
-        self._is_running = True
-        self.last_run_time = datetime.datetime.now()
+    def start(self, time_now: datetime.datetime, monotonic_now: float):
+        self._running.set()
+        self.last_run_time = time_now
+        self.last_run_monotonic = monotonic_now
 
     def stop(self):
-        self._is_running = False
+        self._running.clear()
 
 
 class JobSchedule(object):
+    __slots__ = ('_name', '_second', '_minute', '_hour', '_weekday', '_day', '_tag')
+
     def __init__(self):
         self._name = None
         self._second = set()
@@ -74,12 +180,20 @@ class JobSchedule(object):
 
 # noinspection PyUnresolvedReferences
 class SettableJobScheduler(JobSchedule):
+    __slots__ = ('is_daemon', '_is_sealed', '_interval', '_interval_unit', '_interval_seconds',
+                 '_masks',
+                 '_matches', '_is_stop', '_stop_until_time')
+
     def __init__(self):
         JobSchedule.__init__(self)
         self.is_daemon = False
         self._is_sealed = False
         self._interval = 0
-        self._interval_unit = ''
+        self._interval_unit: Optional[str] = None
+        self._interval_seconds = 0
+        # (second, minute, hour, day, weekday) bit masks, filled in by seal()
+        self._masks: Tuple[int, int, int, int, int] = (-1, -1, -1, -1, -1)
+        self._matches: Callable[[datetime.datetime], bool] = _match_any
         self._is_stop = False
         self._stop_until_time: datetime.datetime = datetime.datetime.min
 
@@ -102,6 +216,21 @@ class SettableJobScheduler(JobSchedule):
     def add_day(self, day):
         self._day.add(day)
 
+    def extend_minute(self, minutes: Iterable[int]):
+        self._minute.update(minutes)
+
+    def extend_second(self, seconds: Iterable[int]):
+        self._second.update(seconds)
+
+    def extend_hour(self, hours: Iterable[int]):
+        self._hour.update(hours)
+
+    def extend_weekday(self, weekdays: Iterable[int]):
+        self._weekday.update(weekdays)
+
+    def extend_day(self, days: Iterable[int]):
+        self._day.update(days)
+
     def stop(self):
         self._is_stop = True
 
@@ -114,6 +243,9 @@ class SettableJobScheduler(JobSchedule):
         self._hour = frozenset(self._hour)
         self._weekday = frozenset(self._weekday)
         self._day = frozenset(self._day)
+        self._masks = (_bit_mask(self._second), _bit_mask(self._minute), _bit_mask(self._hour),
+                       _bit_mask(self._day), _bit_mask(self._weekday))
+        self._matches = _compile_matcher(*self._masks)
         self._is_sealed = True
 
     def is_scheduled(self):
@@ -126,67 +258,113 @@ class SettableJobScheduler(JobSchedule):
 
     def set_interval(self, interval: int, unit: str):
         self._check_sealed()
-        if self._interval_unit != '' and self._interval_unit != unit:
+        # units are the interned _UNIT_* constants, so identity is enough
+        if self._interval_unit is not None and self._interval_unit is not unit:
             raise ValueError('interval can only be set once')
 
         self._interval = interval
         self._interval_unit = unit
+        self._interval_seconds = interval * _UNIT_SECONDS[unit]
 
-    def should_run(self, last_run_time: datetime.datetime):
+    def should_run(self, last_run_monotonic: Optional[float], time_now: datetime.datetime, monotonic_now: float):
         if self._is_stop:
             return False
 
-        time_now = datetime.datetime.now()
         if self._stop_until_time >= time_now:
             return False
 
-        for one_check in [(self.at_seconds, time_now.second),
-                          (self.at_minutes, time_now.minute),
-                          (self.at_hours, time_now.hour),
-                          (self.at_days, time_now.day),
-                          (self.at_weekdays, time_now.weekday())]:
-            if one_check[0] and one_check[1] not in one_check[0]:
-                return False
+        if not self._matches(time_now):
+            return False
 
-        if last_run_time:
+        if last_run_monotonic is not None:
             if self._interval > 0:
-                intervals = {
-                    'minute': datetime.timedelta(minutes=self._interval),
-                    'second': datetime.timedelta(seconds=self._interval),
-                    'hour': datetime.timedelta(hours=self._interval),
-                    'day': datetime.timedelta(days=self._interval),
-                }
-                next_time_to_run = last_run_time + intervals[self._interval_unit]
-                if next_time_to_run > time_now:
+                if monotonic_now - last_run_monotonic < self._interval_seconds - _INTERVAL_ALLOWANCE:
                     return False
 
         return True
 
+    def next_fire_time(self, last_run_monotonic: Optional[float], after: datetime.datetime, after_monotonic: float) \
+            -> Optional[datetime.datetime]:
+        if self._is_stop:
+            return None
+
+        try:
+            candidate = _ceil_second(after)
+            if self._stop_until_time >= candidate:
+                # the first whole second strictly after stop_until
+                if self._stop_until_time.microsecond:
+                    candidate = _ceil_second(self._stop_until_time)
+                else:
+                    candidate = self._stop_until_time + _ONE_SECOND
+
+            if last_run_monotonic is not None and self._interval > 0:
+                remaining = last_run_monotonic + self._interval_seconds - _INTERVAL_ALLOWANCE - after_monotonic
+                if remaining > 0:
+                    candidate = max(candidate, _ceil_second(after + datetime.timedelta(seconds=remaining)))
+
+            second_mask, minute_mask, hour_mask, day_mask, weekday_mask = self._masks
+            skipped_days = 0
+            while skipped_days <= _MAX_SKIPPED_DAYS:
+                if not (day_mask >> candidate.day) & 1 or not (weekday_mask >> candidate.weekday()) & 1:
+                    candidate = candidate.replace(hour=0, minute=0, second=0) + _ONE_DAY
+                    skipped_days += 1
+                    continue
+
+                hour = _next_in_mask(hour_mask, candidate.hour, 24)
+                if hour is None:
+                    candidate = candidate.replace(hour=0, minute=0, second=0) + _ONE_DAY
+                    skipped_days += 1
+                    continue
+                if hour != candidate.hour:
+                    candidate = candidate.replace(hour=hour, minute=0, second=0)
+
+                minute = _next_in_mask(minute_mask, candidate.minute, 60)
+                if minute is None:
+                    candidate = candidate.replace(minute=0, second=0) + _ONE_HOUR
+                    continue
+                if minute != candidate.minute:
+                    candidate = candidate.replace(minute=minute, second=0)
+
+                second = _next_in_mask(second_mask, candidate.second, 60)
+                if second is None:
+                    candidate = candidate.replace(second=0) + _ONE_MINUTE
+                    continue
+                return candidate.replace(second=second)
+        except OverflowError:
+            # nothing can fire after datetime.max, e.g. a job paused with stop_until(datetime.max)
+            return None
+
+        return None
+
 
 class JobEvery(object):
+    __slots__ = ('_interval', '_job', '_scheduler')
+
     def __init__(self, interval: int, job: 'Job', scheduler: SettableJobScheduler):
         self._interval = interval
         self._job = job
         self._scheduler = scheduler
 
     def minute(self):
-        self._scheduler.set_interval(self._interval, 'minute')
+        self._scheduler.set_interval(self._interval, _UNIT_MINUTE)
         return self._job
 
     def second(self):
-        self._scheduler.set_interval(self._interval, 'second')
+        self._scheduler.set_interval(self._interval, _UNIT_SECOND)
         return self._job
 
     def hour(self):
-        self._scheduler.set_interval(self._interval, 'hour')
+        self._scheduler.set_interval(self._interval, _UNIT_HOUR)
         return self._job
 
     def day(self):
-        self._scheduler.set_interval(self._interval, 'day')
+        self._scheduler.set_interval(self._interval, _UNIT_DAY)
         return self._job
 
 
 class Job(object):
+    __slots__ = ('_job_schedule', '_interval')
+
     def __init__(self, scheduler: SettableJobScheduler):
         self._job_schedule = scheduler
         self._interval = None
@@ -203,11 +381,11 @@ class Job(object):
         if weekday is None and day is None and hour is None and minute is None and second is None:
             raise ValueError("You must specify at least one argument")
 
-        self._add_at(weekday, self._job_schedule.add_weekday)
-        self._add_at(day, self._job_schedule.add_day)
-        self._add_at(hour, self._job_schedule.add_hour)
-        self._add_at(minute, self._job_schedule.add_minute)
-        self._add_at(second, self._job_schedule.add_second)
+        self._add_at(weekday, self._job_schedule.add_weekday, self._job_schedule.extend_weekday)
+        self._add_at(day, self._job_schedule.add_day, self._job_schedule.extend_day)
+        self._add_at(hour, self._job_schedule.add_hour, self._job_schedule.extend_hour)
+        self._add_at(minute, self._job_schedule.add_minute, self._job_schedule.extend_minute)
+        self._add_at(second, self._job_schedule.add_second, self._job_schedule.extend_second)
         return self
 
     def name(self, job_name: str):
@@ -219,18 +397,20 @@ class Job(object):
         return self
 
     # noinspection PyMethodMayBeStatic
-    def _add_at(self, value: Union[int, Sequence[int], None], add_method: Callable[[int], None]):
+    def _add_at(self, value: Union[int, Sequence[int], None], add_method: Callable[[int], None],
+                extend_method: Callable[[Iterable[int]], None]):
         if value is None:
             return
 
         if isinstance(value, int):
             add_method(value)
         else:
-            for one_value in value:
-                add_method(one_value)
+            extend_method(value)
 
 
 class RuntimeService(object):
+    __slots__ = ('_scheduler',)
+
     def __init__(self, scheduler: 'SettableJobScheduler'):
         self._scheduler = scheduler
 
@@ -245,11 +425,13 @@ class RuntimeService(object):
 
 
 class RunnableJob(object):
-    def __init__(self, handler: types.FunctionType, scheduler: SettableJobScheduler, schedulers: List[SettableJobScheduler], custom_scheduler: Callable[[JobSchedule], bool]):
+    __slots__ = ('_assigned_names', '_handler', '_has_parameter', '_job_schedule', '_name', '_job_status', '_custom_scheduler')
+
+    def __init__(self, handler: types.FunctionType, scheduler: SettableJobScheduler, assigned_names: Set[str], custom_scheduler: Callable[[JobSchedule], bool]):
         if not scheduler.is_scheduled():
             raise ValueError(f"job '{scheduler.name}' is not scheduled")
 
-        self._job_schedules = schedulers
+        self._assigned_names = assigned_names
         self._handler = handler
         self._has_parameter = handler.__code__.co_argcount > 0
 
@@ -258,14 +440,15 @@ class RunnableJob(object):
 
         self._job_schedule = scheduler
         self._job_schedule.seal()
+        self._name = scheduler.name
         self._job_status = JobStatus()
         self._custom_scheduler = custom_scheduler
 
-    def should_run(self):
+    def should_run(self, time_now: datetime.datetime, monotonic_now: float):
         if self._job_status.is_running:
             return False
 
-        if not self._job_schedule.should_run(self._job_status.last_run_time):
+        if not self._job_schedule.should_run(self._job_status.last_run_monotonic, time_now, monotonic_now):
             return False
 
         if self._custom_scheduler:
@@ -273,66 +456,73 @@ class RunnableJob(object):
 
         return True
 
-    def run(self):
-        job_thread = threading.Thread(target=self._run_internal)
-        job_thread.daemon = self._job_schedule.is_daemon
-        job_thread.start()
+    def next_fire_time(self, after: datetime.datetime, after_monotonic: float) -> Optional[datetime.datetime]:
+        return self._job_schedule.next_fire_time(self._job_status.last_run_monotonic, after, after_monotonic)
+
+    def run(self, time_now: datetime.datetime, monotonic_now: float, executor: ThreadPoolExecutor):
+        self._job_status.start(time_now, monotonic_now)
+        if self._job_schedule.is_daemon:
+            # pool workers are always joined at interpreter exit, so daemon jobs keep their own thread
+            job_thread = threading.Thread(target=self._run_internal)
+            job_thread.daemon = True
+            job_thread.start()
+        else:
+            executor.submit(self._run_internal)
 
     def _run_internal(self):
-        logger.debug(f'Starting job {self._job_schedule.name}')
-        self._job_status.start()
+        logger.debug('Starting job %s', self._name)
         try:
             if self._has_parameter:
                 self._handler(RuntimeService(self._job_schedule))
             else:
                 self._handler()
         except:
-            logger.exception(f'Failed to run job {self._job_schedule.name}.')
+            logger.exception('Failed to run job %s.', self._name)
         finally:
-            logger.debug(f'Completed job {self._job_schedule.name}')
+            logger.debug('Completed job %s', self._name)
             self._job_status.stop()
 
     def _create_handle_name(self):
-        name = ''
-        if hasattr(self._handler, '__module__'):
-            name = getattr(self._handler, '__module__')
-
-        if hasattr(self._handler, '__name__'):
-            name += f":{getattr(self._handler, '__name__')}"
+        name = getattr(self._handler, '__module__', None) or ''
+        handler_name = getattr(self._handler, '__name__', None)
+        if handler_name is not None:
+            name += f':{handler_name}'
 
         if not name:
             return f"JOB_{uuid.uuid4()}"
 
-        index = 0
-        while True:
+        index = 1
+        candidate_name = name
+        while candidate_name in self._assigned_names:
             index += 1
-            candidate_name = name if index == 1 else f'{name}:{index}'
-            if any(x.name == candidate_name for x in self._job_schedules):
-                continue
-            else:
-                return candidate_name
+            candidate_name = f'{name}:{index}'
+
+        self._assigned_names.add(candidate_name)
+        return candidate_name
 
 
 class CronnerEvery(object):
+    __slots__ = ('_interval', '_scheduler_getter')
+
     def __init__(self, interval: int, get_scheduler_func: Callable[[Any], SettableJobScheduler]):
         self._interval = interval
         self._scheduler_getter = get_scheduler_func
 
     @property
     def minute(self):
-        return self.__set('minute')
+        return self.__set(_UNIT_MINUTE)
 
     @property
     def second(self):
-        return self.__set('second')
+        return self.__set(_UNIT_SECOND)
 
     @property
     def hour(self):
-        return self.__set('hour')
+        return self.__set(_UNIT_HOUR)
 
     @property
     def day(self):
-        return self.__set('day')
+        return self.__set(_UNIT_DAY)
 
     def __set(self, unit):
         def register_action(action):
@@ -347,6 +537,8 @@ class Cronner(object):
         self._job_definitions: dict[Callable[['RuntimeService', None], bool], Tuple[Job, SettableJobScheduler]] = {}
         self._jobs: List[RunnableJob] = []
         self._custom_scheduler = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._shutdown = threading.Event()
 
     def name(self, job_name: str):
         def wrapper(action):
@@ -367,23 +559,16 @@ class Cronner(object):
         if weekday is None and day is None and hour is None and minute is None and second is None:
             raise ValueError("You must specify at least one argument")
 
-        def _add_at_item(items: Union[int, Sequence[int], None], add_method: Callable[[int], None]) -> None:
-            if items is None:
-                return
-
-            if isinstance(items, int):
-                add_method(items)
-            else:
-                for item in items:
-                    add_method(item)
+        days, weekdays, hours, minutes, seconds = \
+            _as_tuple(day), _as_tuple(weekday), _as_tuple(hour), _as_tuple(minute), _as_tuple(second)
 
         def register_action(action):
             _, scheduler = self._get_or_add_job(action)
-            _add_at_item(day, scheduler.add_day)
-            _add_at_item(weekday, scheduler.add_weekday)
-            _add_at_item(hour, scheduler.add_hour)
-            _add_at_item(minute, scheduler.add_minute)
-            _add_at_item(second, scheduler.add_second)
+            scheduler.extend_day(days)
+            scheduler.extend_weekday(weekdays)
+            scheduler.extend_hour(hours)
+            scheduler.extend_minute(minutes)
+            scheduler.extend_second(seconds)
             return action
 
         return register_action
@@ -393,21 +578,80 @@ class Cronner(object):
         return job
 
     def start(self):
-        schedulers = [v[1] for k, v in self._job_definitions.items()]
+        if self._executor is not None:
+            raise RuntimeError('Cronner can only be started once')
+
+        assigned_names = {v[1].name for v in self._job_definitions.values() if v[1].name}
         for key, value in self._job_definitions.items():
-            self._jobs.append(RunnableJob(key, value[1], schedulers, self._custom_scheduler))
+            self._jobs.append(RunnableJob(key, value[1], assigned_names, self._custom_scheduler))
 
         self._job_definitions.clear()
-        while True:
-            try:
-                for item in self._jobs:
-                    if item.should_run():
-                        item.run()
-            except:
-                logger.exception('Failed to start jobs')
-                raise
-            finally:
-                time.sleep(1)
+        # every job runs at most once at a time, so one worker per job never starves a due job
+        self._executor = ThreadPoolExecutor(max_workers=max(len(self._jobs), 1), thread_name_prefix='pycronner')
+        try:
+            time_now, monotonic_now = datetime.datetime.now(), time.monotonic()
+            clock_origin = time_now - datetime.timedelta(seconds=monotonic_now)
+            fire_queue: List[Tuple[datetime.datetime, int, RunnableJob]] = []
+            for item in self._jobs:
+                self._push_next_fire(fire_queue, item, time_now, monotonic_now)
+
+            while fire_queue and not self._shutdown.is_set():
+                try:
+                    time_now, monotonic_now = datetime.datetime.now(), time.monotonic()
+                    last_clock_origin, clock_origin = clock_origin, time_now - datetime.timedelta(seconds=monotonic_now)
+                    if abs((clock_origin - last_clock_origin).total_seconds()) > _CLOCK_STEP_THRESHOLD:
+                        # fire times are wall-clock times; recompute them all, interval jobs from the monotonic clock
+                        logger.info('System clock changed, rescheduling jobs')
+                        self._reschedule_all(fire_queue, time_now, monotonic_now)
+                        continue
+
+                    # the wait runs on the monotonic clock; capping it means a clock step is caught above
+                    # within _MAX_WAIT, before the fire times it jumped over are passed
+                    delay = (fire_queue[0][0] - time_now).total_seconds()
+                    if delay > 0:
+                        self._shutdown.wait(timeout=min(delay, _MAX_WAIT))
+                        continue
+
+                    # only jobs that are due are dispatched; the executor queues them for its workers
+                    after = time_now.replace(microsecond=0) + _ONE_SECOND
+                    after_monotonic = monotonic_now + (after - time_now).total_seconds()
+                    while fire_queue and fire_queue[0][0] <= time_now and not self._shutdown.is_set():
+                        fire_time, _, item = heapq.heappop(fire_queue)
+                        if item.should_run(fire_time, monotonic_now):
+                            item.run(fire_time, monotonic_now, self._executor)
+                        self._push_next_fire(fire_queue, item, after, after_monotonic)
+                except:
+                    logger.exception('Failed to start jobs')
+                    raise
+        finally:
+            # a job never overlaps itself and there is a worker per job, so nothing waits in the queue to be
+            # cancelled; running jobs are left to finish
+            self._executor.shutdown(wait=False)
+
+        if self._shutdown.is_set():
+            logger.info('Scheduler is shut down')
+        else:
+            logger.info('No scheduled jobs left')
+
+    def shutdown(self):
+        self._shutdown.set()
+
+    # noinspection PyMethodMayBeStatic
+    def _push_next_fire(self, fire_queue: List[Tuple[datetime.datetime, int, RunnableJob]], job: RunnableJob,
+                        after: datetime.datetime, after_monotonic: float):
+        next_fire = job.next_fire_time(after, after_monotonic)
+        if next_fire is not None:
+            heapq.heappush(fire_queue, (next_fire, id(job), job))
+
+    def _reschedule_all(self, fire_queue: List[Tuple[datetime.datetime, int, RunnableJob]],
+                        time_now: datetime.datetime, monotonic_now: float):
+        # start from the current second so that a job which is due now is not pushed back by a second
+        after = time_now.replace(microsecond=0)
+        after_monotonic = monotonic_now - time_now.microsecond / 1000000
+        jobs = [item for _, _, item in fire_queue]
+        fire_queue.clear()
+        for item in jobs:
+            self._push_next_fire(fire_queue, item, after, after_monotonic)
 
     @property
     def register_custom_scheduler(self):
@@ -425,14 +669,13 @@ class Cronner(object):
         return scheduler
 
     def _get_or_add_job(self, action):
-        result = self._job_definitions.get(action)
-        if result is not None:
+        try:
+            return self._job_definitions[action]
+        except KeyError:
+            scheduler = SettableJobScheduler()
+            result = (Job(scheduler), scheduler)
+            self._job_definitions[action] = result
             return result
 
-        scheduler = SettableJobScheduler()
-        result = (Job(scheduler), scheduler)
-        self._job_definitions[action] = result
-        return result
-
 
 cronner = Cronner()
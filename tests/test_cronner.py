@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+import datetime
+import types
+import unittest
+from unittest import mock
+
+from pycronner import _cronner
+from pycronner._cronner import Cronner, SettableJobScheduler
+
+
+class NextFireTimeTest(unittest.TestCase):
+    def _scheduler(self, **at):
+        scheduler = SettableJobScheduler()
+        for second in at.get('second', ()):
+            scheduler.add_second(second)
+        scheduler.seal()
+        return scheduler
+
+    def test_stop_until_with_fraction_resumes_on_next_whole_second(self):
+        scheduler = self._scheduler(second=[1])
+        scheduler.stop_until(datetime.datetime(2026, 3, 8, 10, 0, 0, 300000))
+        after = datetime.datetime(2026, 3, 8, 10, 0, 0)
+
+        next_fire = scheduler.next_fire_time(None, after, 0.0)
+
+        self.assertEqual(datetime.datetime(2026, 3, 8, 10, 0, 1), next_fire)
+        self.assertTrue(scheduler.should_run(None, next_fire, 0.0))
+
+    def test_stop_until_on_whole_second_resumes_after_it(self):
+        scheduler = self._scheduler(second=[0, 1])
+        scheduler.stop_until(datetime.datetime(2026, 3, 8, 10, 0, 0))
+        after = datetime.datetime(2026, 3, 8, 10, 0, 0)
+
+        next_fire = scheduler.next_fire_time(None, after, 0.0)
+
+        self.assertEqual(datetime.datetime(2026, 3, 8, 10, 0, 1), next_fire)
+        self.assertFalse(scheduler.should_run(None, after, 0.0))
+
+    def test_stop_until_max_has_no_next_fire(self):
+        scheduler = self._scheduler(second=[0])
+        scheduler.stop_until(datetime.datetime.max)
+
+        self.assertIsNone(scheduler.next_fire_time(None, datetime.datetime(2026, 3, 8), 0.0))
+
+
+class FakeClock(object):
+    def __init__(self, wall: datetime.datetime, end: datetime.datetime):
+        self.wall = wall
+        self.monotonic_now = 1000.0
+        self.end = end
+        self.steps = []
+        self.is_shut_down = False
+
+    def step_at(self, at: datetime.datetime, by: datetime.timedelta):
+        self.steps.append((at, by))
+
+    def now(self):
+        return self.wall
+
+    def monotonic(self):
+        return self.monotonic_now
+
+    def wait(self, timeout=None):
+        self.wall += datetime.timedelta(seconds=timeout)
+        self.monotonic_now += timeout
+        for at, by in list(self.steps):
+            if self.wall >= at:
+                self.steps.remove((at, by))
+                self.wall += by
+        if self.wall >= self.end:
+            self.is_shut_down = True
+        return self.is_shut_down
+
+    def is_set(self):
+        return self.is_shut_down
+
+    def set(self):
+        self.is_shut_down = True
+
+
+class InlineExecutor(object):
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def submit(self, fn):
+        fn()
+
+    def shutdown(self, wait=True):
+        pass
+
+
+class CronnerLoopTest(unittest.TestCase):
+    def _run(self, cronner: Cronner, clock: FakeClock):
+        fake_datetime = type('datetime', (datetime.datetime,), {'now': staticmethod(clock.now)})
+        cronner._shutdown = clock
+        with mock.patch.object(_cronner, 'datetime', types.SimpleNamespace(datetime=fake_datetime,
+                                                                           timedelta=datetime.timedelta)), \
+                mock.patch.object(_cronner, 'time', types.SimpleNamespace(monotonic=clock.monotonic)), \
+                mock.patch.object(_cronner, 'ThreadPoolExecutor', InlineExecutor):
+            cronner.start()
+
+    def test_forward_clock_step_during_wait_does_not_skip_run(self):
+        clock = FakeClock(datetime.datetime(2026, 3, 8, 8, 0, 0), end=datetime.datetime(2026, 3, 11, 12, 0, 0))
+        clock.step_at(datetime.datetime(2026, 3, 9, 2, 0, 0), datetime.timedelta(hours=1))
+        cronner = Cronner()
+        fired = []
+
+        @cronner.at(hour=9, minute=0, second=0)
+        def job():
+            fired.append(clock.now())
+
+        self._run(cronner, clock)
+
+        self.assertEqual([datetime.datetime(2026, 3, day, 9, 0, 0) for day in (8, 9, 10, 11)], fired)
+
+    def test_backward_clock_step_does_not_stall_interval_job(self):
+        clock = FakeClock(datetime.datetime(2026, 11, 1, 1, 0, 0), end=datetime.datetime(2026, 11, 1, 1, 50, 0))
+        clock.step_at(datetime.datetime(2026, 11, 1, 1, 30, 0), -datetime.timedelta(hours=1))
+        cronner = Cronner()
+        fired = []
+
+        @cronner.every(10).minute
+        def job():
+            fired.append(clock.monotonic())
+
+        self._run(cronner, clock)
+
+        # 110 minutes pass on the monotonic clock before the wall clock reaches the end
+        self.assertEqual([1000.0 + 600 * index for index in range(11)], fired)
+
+    def test_start_after_shutdown_is_rejected(self):
+        clock = FakeClock(datetime.datetime(2026, 3, 8, 8, 0, 0), end=datetime.datetime(2026, 3, 8, 8, 0, 10))
+        cronner = Cronner()
+
+        @cronner.every(1).second
+        def job():
+            pass
+
+        self._run(cronner, clock)
+        cronner.shutdown()
+
+        with self.assertRaises(RuntimeError):
+            cronner.start()
+        self.assertEqual(1, len(cronner._jobs))
+
+
+if __name__ == '__main__':
+    unittest.main()